@@ -3,250 +3,536 @@ Batch SEO Analyzer - Analyze multiple URLs and generate comparison report
 Perfect for demonstrating data extraction and analysis capabilities
 """
 
+import asyncio
+import aiohttp
+from array import array
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound, ParserRejectedMarkup
 import json
 import csv
+import hashlib
+import math
+import re
 from datetime import datetime
-from typing import List, Dict
-import time
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Iterator, Mapping
 from urllib.parse import urlparse
+from diskcache import Cache
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder
+    orjson = None
+
+USER_AGENT = 'Mozilla/5.0 (compatible; SEOBatchAnalyzer/1.0)'
+
+# Pages past this size are reported as errors instead of being held in memory
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+CHUNK_SIZE = 65536
+
+# Batch results are stored column-wise: field name -> array typecode
+# ('i' int, 'd' float, 'b' bool) or None for object columns (strings / optional)
+RESULT_SCHEMA = {
+    'url': None,
+    'domain': None,
+    'timestamp': None,
+    'title': None,
+    'title_length': 'i',
+    'meta_description': None,
+    'desc_length': 'i',
+    'h1_count': 'i',
+    'h2_count': 'i',
+    'h3_count': 'i',
+    'internal_links': 'i',
+    'external_links': 'i',
+    'total_images': 'i',
+    'images_with_alt': 'i',
+    'alt_ratio': 'd',
+    'word_count': 'i',
+    'has_viewport': 'b',
+    'has_canonical': 'b',
+    'has_hreflang': 'b',
+    'has_schema': 'b',
+    'lang_attribute': None,
+    'has_arabic_support': 'b',
+    'has_lang_switcher': 'b',
+    'og_tags_count': 'i',
+    'has_og_locale': 'b',
+    'seo_score': 'i',
+    'localization_score': 'i',
+    'status': None,
+    'error_message': None,
+}
+ERROR_FIELDS = ('url', 'timestamp', 'status', 'error_message')
+# Columns kept only for scoring: carried in result rows (so they round-trip through
+# the results setter) but left out of CSV/JSON exports
+SCORING_ONLY_FIELDS = ('has_og_locale',)
+EXPORT_FIELDS = [name for name in RESULT_SCHEMA if name not in SCORING_ONLY_FIELDS]
+
+# Compiled once so bs4 filters don't call back into Python lambdas per node
+_OG_RE = re.compile(r'^og:')
+_LANG_SWITCHER_RE = re.compile(r'/(ar|en)/')
+
+# SEO score tiers per metric as (lower, upper, points), inclusive bounds; the first
+# matching tier wins. Title 20, description 15, H1 10, alt text 10, content 15 points
+SEO_TIERS = {
+    'title_length': ((30, 60, 20), (1, math.inf, 10)),
+    'desc_length': ((120, 160, 15), (1, math.inf, 8)),
+    'h1_count': ((1, 1, 10), (2, math.inf, 5)),
+    'alt_ratio': ((80, math.inf, 10), (50, math.inf, 5)),
+    'word_count': ((300, math.inf, 15), (150, math.inf, 8)),
+}
+# Technical SEO (30 points) and localization (25 points per signal)
+TECHNICAL_FIELDS = ('has_viewport', 'has_canonical', 'has_schema')
+TECHNICAL_POINTS = 10
+LOCALIZATION_POINTS = 25
+
+def _tier_points(value: float, tiers: tuple) -> int:
+    """Return the points of the first tier whose bounds contain value"""
+    for lower, upper, points in tiers:
+        if lower <= value <= upper:
+            return points
+    return 0
+
+def _tier_select(values: pd.Series, tiers: tuple) -> np.ndarray:
+    """Vectorized _tier_points over a column (NaN matches no tier)"""
+    conditions = [values.between(lower, upper) for lower, upper, _ in tiers]
+    return np.select(conditions, [points for _, _, points in tiers], default=0)
+
+@lru_cache(maxsize=1024)
+def _netloc(url: str) -> str:
+    """Host part of a URL, memoized since batches repeat the same hosts"""
+    return urlparse(url).netloc
 
 class BatchSEOAnalyzer:
     """Batch analyzer for multiple URLs with comparative analytics"""
     
-    def __init__(self, urls: List[str]):
+    def __init__(self, urls: List[str], max_concurrency: int = 10,
+                 cache_dir: str = '.seo_cache'):
         self.urls = urls
-        self.results = []
+        self.columns = self._empty_columns()
+        self.max_concurrency = max_concurrency
+        # Shared timestamp for every row of the batch currently running
+        self._batch_ts = None
+        
+        # Parsed results keyed by URL hash, raw HTML stored by content hash
+        self.cache = Cache(cache_dir)
+        self.html_dir = Path(cache_dir) / 'html'
+        self.html_dir.mkdir(parents=True, exist_ok=True)
         
-    def analyze_single_url(self, url: str) -> Dict:
+        # Persistent session so repeated hits on the same host reuse connections
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT})
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+    def analyze_single_url(self, url: str, force_refresh: bool = False) -> Dict:
         """Analyze a single URL and return metrics"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (compatible; SEOBatchAnalyzer/1.0)'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract metadata
-            title = soup.find('title')
-            title_text = title.string.strip() if title else None
-            title_length = len(title_text) if title_text else 0
-            
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            meta_desc_text = meta_desc.get('content', '').strip() if meta_desc else None
-            desc_length = len(meta_desc_text) if meta_desc_text else 0
-            
-            # Count elements
-            h1_count = len(soup.find_all('h1'))
-            h2_count = len(soup.find_all('h2'))
-            h3_count = len(soup.find_all('h3'))
-            
-            # Link analysis
-            all_links = soup.find_all('a', href=True)
-            domain = urlparse(url).netloc
-            internal_links = sum(1 for link in all_links 
-                               if link['href'].startswith('/') or domain in link['href'])
-            external_links = len(all_links) - internal_links
-            
-            # Image analysis
-            images = soup.find_all('img')
-            total_images = len(images)
-            images_with_alt = sum(1 for img in images if img.get('alt'))
-            alt_ratio = (images_with_alt / total_images * 100) if total_images > 0 else 0
-            
-            # Content analysis
-            text_content = soup.get_text(separator=' ', strip=True)
-            word_count = len(text_content.split())
-            
-            # Technical SEO
-            has_viewport = bool(soup.find('meta', attrs={'name': 'viewport'}))
-            has_canonical = bool(soup.find('link', rel='canonical'))
-            has_hreflang = bool(soup.find('link', rel='alternate', hreflang=True))
-            has_schema = bool(soup.find('script', type='application/ld+json'))
-            
-            # Language detection
-            html_tag = soup.find('html')
-            lang_attr = html_tag.get('lang') if html_tag else None
-            
-            # Check for bilingual indicators
-            has_arabic = bool(soup.find(attrs={'dir': 'rtl'}))
-            has_lang_switcher = bool(soup.find('a', href=lambda x: x and ('/ar/' in x or '/en/' in x)))
-            
-            # OpenGraph tags
-            og_tags = {}
-            for meta in soup.find_all('meta', property=lambda x: x and x.startswith('og:')):
-                prop = meta.get('property', '').replace('og:', '')
-                content = meta.get('content', '')
-                og_tags[prop] = content
-            
-            # Calculate scores
-            seo_score = self._calculate_seo_score({
-                'title_length': title_length,
-                'desc_length': desc_length,
-                'h1_count': h1_count,
-                'alt_ratio': alt_ratio,
-                'word_count': word_count,
-                'has_viewport': has_viewport,
-                'has_canonical': has_canonical,
-                'has_schema': has_schema
-            })
-            
-            localization_score = self._calculate_localization_score({
-                'lang_attr': lang_attr,
-                'has_hreflang': has_hreflang,
-                'has_arabic': has_arabic,
-                'has_lang_switcher': has_lang_switcher,
-                'og_locale': 'locale' in og_tags
-            })
-            
-            return {
-                'url': url,
-                'domain': domain,
-                'timestamp': datetime.now().isoformat(),
-                'title': title_text,
-                'title_length': title_length,
-                'meta_description': meta_desc_text,
-                'desc_length': desc_length,
-                'h1_count': h1_count,
-                'h2_count': h2_count,
-                'h3_count': h3_count,
-                'internal_links': internal_links,
-                'external_links': external_links,
-                'total_images': total_images,
-                'images_with_alt': images_with_alt,
-                'alt_ratio': round(alt_ratio, 2),
-                'word_count': word_count,
-                'has_viewport': has_viewport,
-                'has_canonical': has_canonical,
-                'has_hreflang': has_hreflang,
-                'has_schema': has_schema,
-                'lang_attribute': lang_attr,
-                'has_arabic_support': has_arabic,
-                'has_lang_switcher': has_lang_switcher,
-                'og_tags_count': len(og_tags),
-                'seo_score': seo_score,
-                'localization_score': localization_score,
-                'status': 'success'
-            }
-            
+            headers = self._conditional_headers(url, force_refresh)
+            with self.session.get(url, headers=headers, timeout=10, stream=True) as response:
+                if response.status_code == 304:
+                    result = self._cached_result(url)
+                else:
+                    response.raise_for_status()
+                    html = self._read_capped(response.iter_content(CHUNK_SIZE))
+                    result = self._parse_and_cache(url, html, response.headers, force_refresh)
+            self._score_row(result)
+            return result
         except Exception as e:
-            return {
-                'url': url,
-                'timestamp': datetime.now().isoformat(),
-                'status': 'error',
-                'error_message': str(e)
-            }
+            return self._error_result(url, e)
     
-    def _calculate_seo_score(self, metrics: Dict) -> int:
-        """Calculate SEO score based on metrics"""
-        score = 0
-        
-        # Title optimization (20 points)
-        title_len = metrics['title_length']
-        if 30 <= title_len <= 60:
-            score += 20
-        elif title_len > 0:
-            score += 10
-        
-        # Meta description (15 points)
-        desc_len = metrics['desc_length']
-        if 120 <= desc_len <= 160:
-            score += 15
-        elif desc_len > 0:
-            score += 8
-        
-        # H1 tags (10 points)
-        if metrics['h1_count'] == 1:
-            score += 10
-        elif metrics['h1_count'] > 0:
-            score += 5
-        
-        # Alt text (10 points)
-        if metrics['alt_ratio'] >= 80:
-            score += 10
-        elif metrics['alt_ratio'] >= 50:
-            score += 5
-        
-        # Content length (15 points)
-        if metrics['word_count'] >= 300:
-            score += 15
-        elif metrics['word_count'] >= 150:
-            score += 8
-        
-        # Technical SEO (30 points)
-        if metrics['has_viewport']:
-            score += 10
-        if metrics['has_canonical']:
-            score += 10
-        if metrics['has_schema']:
-            score += 10
-        
-        return min(score, 100)
+    @property
+    def results(self) -> List[Dict]:
+        """Batch results as a list of row dicts (rebuilt from the column store on each access)"""
+        return list(self.iter_results())
     
-    def _calculate_localization_score(self, metrics: Dict) -> int:
-        """Calculate localization score"""
-        score = 0
-        
-        if metrics['lang_attr']:
-            score += 25
-        if metrics['has_hreflang']:
-            score += 25
-        if metrics['has_arabic'] or metrics['has_lang_switcher']:
-            score += 25
-        if metrics['og_locale']:
-            score += 25
-        
-        return score
+    @results.setter
+    def results(self, results: List[Dict]):
+        """Replace the column store with the given row dicts"""
+        self.columns = self._empty_columns()
+        for result in results:
+            self._append_row(result)
     
-    def analyze_all(self) -> List[Dict]:
-        """Analyze all URLs with rate limiting"""
-        print(f"Starting analysis of {len(self.urls)} URLs...")
+    def iter_results(self, exclude: tuple = ()) -> Iterator[Dict]:
+        """Yield batch results one row dict at a time from the column store"""
+        columns = self.columns
+        for i in range(len(columns['url'])):
+            if columns['status'][i] == 'error':
+                yield {name: columns[name][i] for name in ERROR_FIELDS}
+                continue
+            
+            row = {}
+            for name, typecode in RESULT_SCHEMA.items():
+                if name == 'error_message' or name in exclude:
+                    continue
+                value = columns[name][i]
+                row[name] = bool(value) if typecode == 'b' else value
+            yield row
+    
+    @staticmethod
+    def _empty_columns() -> Dict[str, list]:
+        """Fresh column store with one empty array/list per RESULT_SCHEMA field"""
+        return {
+            name: array(typecode) if typecode else []
+            for name, typecode in RESULT_SCHEMA.items()
+        }
+    
+    def _append_row(self, result: Dict):
+        """Append one result to the column store (missing numeric fields become 0)"""
+        for name, typecode in RESULT_SCHEMA.items():
+            value = result.get(name)
+            if typecode:
+                self.columns[name].append(value or 0)
+            else:
+                self.columns[name].append(value)
+    
+    def _frame(self) -> pd.DataFrame:
+        """Build a DataFrame from the column store, copying typed columns at C level"""
+        data = {}
+        for name, typecode in RESULT_SCHEMA.items():
+            column = self.columns[name]
+            if typecode:
+                values = np.frombuffer(column, dtype=typecode).copy()
+                data[name] = values.astype(bool) if typecode == 'b' else values
+            else:
+                data[name] = column
+        return pd.DataFrame(data)
+    
+    @staticmethod
+    def _append_capped(buf: bytearray, chunk: bytes):
+        """Add a body chunk to buf, giving up once it exceeds MAX_PAGE_BYTES"""
+        buf.extend(chunk)
+        if len(buf) > MAX_PAGE_BYTES:
+            raise ValueError('page too large')
+    
+    def _read_capped(self, chunks) -> bytes:
+        """Collect a streamed requests body under the page size cap"""
+        buf = bytearray()
+        for chunk in chunks:
+            self._append_capped(buf, chunk)
+        return bytes(buf)
+    
+    async def _read_capped_async(self, chunks) -> bytes:
+        """Collect a streamed aiohttp body under the page size cap"""
+        buf = bytearray()
+        async for chunk in chunks:
+            self._append_capped(buf, chunk)
+        return bytes(buf)
+    
+    def _timestamp(self) -> str:
+        """Row timestamp: the batch start time, or now for standalone calls"""
+        return self._batch_ts or datetime.now().isoformat()
+    
+    def _cache_key(self, url: str) -> str:
+        """Cache key for a URL"""
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+    
+    def _conditional_headers(self, url: str, force_refresh: bool = False) -> Dict:
+        """Build If-None-Match / If-Modified-Since headers from the cached entry"""
+        entry = None if force_refresh else self.cache.get(self._cache_key(url))
+        if not entry:
+            return {}
         
-        for i, url in enumerate(self.urls, 1):
-            print(f"Analyzing {i}/{len(self.urls)}: {url}")
-            result = self.analyze_single_url(url)
-            self.results.append(result)
+        headers = {}
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def _cached_result(self, url: str) -> Dict:
+        """Return the cached result for a URL the server reported as unchanged"""
+        entry = self.cache[self._cache_key(url)]
+        return {**entry['result'], 'timestamp': self._timestamp()}
+    
+    def _parse_and_cache(self, url: str, html: bytes, headers: Mapping[str, str],
+                         force_refresh: bool = False) -> Dict:
+        """Parse fetched HTML, reusing the cached result if the content is unchanged"""
+        key = self._cache_key(url)
+        content_hash = hashlib.sha1(html).hexdigest()
+        entry = None if force_refresh else self.cache.get(key)
+        
+        if entry and entry['content_hash'] == content_hash:
+            result = {**entry['result'], 'timestamp': self._timestamp()}
+        else:
+            result = self._parse_html(html, url)
+            # Keep the raw page so it can be re-parsed if scoring rules change
+            html_path = self.html_dir / f"{content_hash}.html"
+            if not html_path.exists():
+                html_path.write_bytes(html)
+        
+        self.cache.set(key, {
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'content_hash': content_hash,
+            'result': result
+        })
+        return result
+    
+    def _parse_html(self, html: bytes, url: str) -> Dict:
+        """Parse fetched HTML and extract SEO metrics"""
+        try:
+            soup = BeautifulSoup(html, 'lxml')
+        except (FeatureNotFound, ParserRejectedMarkup):
+            # lxml missing or rejected the markup - fall back to html.parser
+            soup = BeautifulSoup(html, 'html.parser')
+        
+        # Extract metadata
+        title = soup.find('title')
+        title_text = title.string.strip() if title else None
+        title_length = len(title_text) if title_text else 0
+        
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        meta_desc_text = meta_desc.get('content', '').strip() if meta_desc else None
+        desc_length = len(meta_desc_text) if meta_desc_text else 0
+        
+        # Count elements
+        h1_count = len(soup.find_all('h1'))
+        h2_count = len(soup.find_all('h2'))
+        h3_count = len(soup.find_all('h3'))
+        
+        # Link analysis
+        domain = _netloc(url)
+        internal_prefixes = ('/', f'http://{domain}', f'https://{domain}', f'//{domain}')
+        internal_links = external_links = 0
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            if href.startswith(internal_prefixes):
+                internal_links += 1
+            else:
+                external_links += 1
+        
+        # Image analysis
+        total_images = images_with_alt = 0
+        for img in soup.find_all('img'):
+            total_images += 1
+            images_with_alt += bool(img.get('alt'))
+        alt_ratio = (images_with_alt / total_images * 100) if total_images > 0 else 0
+        
+        # Content analysis - count words per string instead of joining the page text
+        word_count = sum(len(text.split()) for text in soup.stripped_strings)
+        
+        # Technical SEO
+        has_viewport = bool(soup.find('meta', attrs={'name': 'viewport'}))
+        has_canonical = bool(soup.find('link', rel='canonical'))
+        has_hreflang = bool(soup.find('link', rel='alternate', hreflang=True))
+        has_schema = bool(soup.find('script', type='application/ld+json'))
+        
+        # Language detection
+        html_tag = soup.find('html')
+        lang_attr = html_tag.get('lang') if html_tag else None
+        
+        # Check for bilingual indicators
+        has_arabic = bool(soup.find(attrs={'dir': 'rtl'}))
+        has_lang_switcher = bool(soup.find('a', href=_LANG_SWITCHER_RE))
+        
+        # OpenGraph tags
+        og_tags = {}
+        for meta in soup.find_all('meta', property=_OG_RE):
+            prop = meta.get('property', '').replace('og:', '')
+            content = meta.get('content', '')
+            og_tags[prop] = content
+        
+        # Scores are filled in afterwards by _score_row / _score_columns
+        return {
+            'url': url,
+            'domain': domain,
+            'timestamp': self._timestamp(),
+            'title': title_text,
+            'title_length': title_length,
+            'meta_description': meta_desc_text,
+            'desc_length': desc_length,
+            'h1_count': h1_count,
+            'h2_count': h2_count,
+            'h3_count': h3_count,
+            'internal_links': internal_links,
+            'external_links': external_links,
+            'total_images': total_images,
+            'images_with_alt': images_with_alt,
+            'alt_ratio': round(alt_ratio, 2),
+            'word_count': word_count,
+            'has_viewport': has_viewport,
+            'has_canonical': has_canonical,
+            'has_hreflang': has_hreflang,
+            'has_schema': has_schema,
+            'lang_attribute': lang_attr,
+            'has_arabic_support': has_arabic,
+            'has_lang_switcher': has_lang_switcher,
+            'og_tags_count': len(og_tags),
+            'has_og_locale': 'locale' in og_tags,
+            'seo_score': None,
+            'localization_score': None,
+            'status': 'success'
+        }
+        
+    def _error_result(self, url: str, error: Exception) -> Dict:
+        """Build the result row for a URL that could not be analyzed"""
+        return {
+            'url': url,
+            'timestamp': self._timestamp(),
+            'status': 'error',
+            'error_message': str(error)
+        }
+    
+    def _score_frame(self, df: pd.DataFrame) -> tuple:
+        """Compute SEO and localization scores for every row of a frame at once"""
+        values = {
+            'title_length': df['title_length'],
+            'desc_length': df['desc_length'],
+            'h1_count': df['h1_count'],
+            # NaN when there are no images, which matches no tier
+            'alt_ratio': df['images_with_alt'] / df['total_images'].where(df['total_images'] > 0) * 100,
+            'word_count': df['word_count'],
+        }
+        seo_score = sum(_tier_select(values[name], tiers) for name, tiers in SEO_TIERS.items())
+        seo_score = seo_score + TECHNICAL_POINTS * df[list(TECHNICAL_FIELDS)].to_numpy(dtype=int).sum(axis=1)
+        seo_score = np.minimum(seo_score, 100)
+        
+        has_lang = df['lang_attribute'].fillna('').astype(bool).to_numpy(dtype=int)
+        has_hreflang = df['has_hreflang'].to_numpy(dtype=int)
+        bilingual = (df['has_arabic_support'] | df['has_lang_switcher']).to_numpy(dtype=int)
+        og_locale = df['has_og_locale'].to_numpy(dtype=int)
+        localization_score = LOCALIZATION_POINTS * (has_lang + has_hreflang + bilingual + og_locale)
+        
+        return seo_score, localization_score
+    
+    def _score_row(self, result: Dict):
+        """Score a single successful result dict in place (same tiers as _score_frame)"""
+        if result.get('status') != 'success':
+            return
+        total_images = result['total_images']
+        values = {
+            'title_length': result['title_length'],
+            'desc_length': result['desc_length'],
+            'h1_count': result['h1_count'],
+            'alt_ratio': result['images_with_alt'] / total_images * 100 if total_images > 0 else 0,
+            'word_count': result['word_count'],
+        }
+        seo_score = sum(_tier_points(values[name], tiers) for name, tiers in SEO_TIERS.items())
+        seo_score += TECHNICAL_POINTS * sum(bool(result[name]) for name in TECHNICAL_FIELDS)
+        result['seo_score'] = min(seo_score, 100)
+        
+        result['localization_score'] = LOCALIZATION_POINTS * sum((
+            bool(result['lang_attribute']),
+            bool(result['has_hreflang']),
+            bool(result['has_arabic_support'] or result['has_lang_switcher']),
+            bool(result['has_og_locale']),
+        ))
+    
+    def _score_columns(self, start: int = 0):
+        """Score the successful rows of the column store from index start onwards"""
+        df = self._frame()
+        success = (df['status'] == 'success').to_numpy(copy=True)
+        # Rows before start were scored earlier (or restored through the results setter)
+        success[:start] = False
+        if not success.any():
+            return
+        
+        seo_score, localization_score = self._score_frame(df[success])
+        for name, scores in (('seo_score', seo_score), ('localization_score', localization_score)):
+            column = np.frombuffer(self.columns[name], dtype='i').copy()
+            column[success] = scores
+            self.columns[name] = array('i', column.tobytes())
+    
+    async def _fetch_and_parse(self, session: aiohttp.ClientSession,
+                               sem: asyncio.Semaphore, url: str,
+                               force_refresh: bool = False) -> Dict:
+        """Fetch a URL under the concurrency limit, then parse it off the event loop"""
+        try:
+            async with sem:
+                print(f"Analyzing: {url}")
+                headers = self._conditional_headers(url, force_refresh)
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        return self._cached_result(url)
+                    response.raise_for_status()
+                    html = await self._read_capped_async(response.content.iter_chunked(CHUNK_SIZE))
             
-            # Rate limiting - be respectful
-            if i < len(self.urls):
-                time.sleep(2)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self._parse_and_cache, url, html, response.headers, force_refresh
+            )
+        except Exception as e:
+            return self._error_result(url, e)
+    
+    async def analyze_all_async(self, force_refresh: bool = False) -> List[Dict]:
+        """Analyze all URLs concurrently, bounded by max_concurrency"""
+        print(f"Starting analysis of {len(self.urls)} URLs...")
+        
+        # Semaphore keeps concurrent requests low enough to avoid rate limiting
+        sem = asyncio.Semaphore(self.max_concurrency)
+        connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=10)
         
+        self._batch_ts = datetime.now().isoformat()
+        try:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                             headers={'User-Agent': USER_AGENT}) as session:
+                results = await asyncio.gather(
+                    *(self._fetch_and_parse(session, sem, url, force_refresh) for url in self.urls)
+                )
+        finally:
+            self._batch_ts = None
+        
+        start = len(self.columns['url'])
+        for result in results:
+            self._append_row(result)
+        self._score_columns(start)
         print("Analysis complete!")
         return self.results
     
+    def analyze_all(self, force_refresh: bool = False) -> List[Dict]:
+        """Analyze all URLs (sync wrapper around analyze_all_async)"""
+        return asyncio.run(self.analyze_all_async(force_refresh))
+    
     def export_to_csv(self, filename: str = 'seo_analysis.csv'):
         """Export results to CSV"""
-        if not self.results:
+        if not self.columns['url']:
             print("No results to export")
             return
         
-        df = pd.DataFrame(self.results)
-        df.to_csv(filename, index=False)
+        # Error rows leave the metric columns empty
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=EXPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.iter_results(exclude=SCORING_ONLY_FIELDS))
         print(f"Results exported to {filename}")
     
     def export_to_json(self, filename: str = 'seo_analysis.json'):
         """Export results to JSON"""
-        if not self.results:
+        if not self.columns['url']:
             print("No results to export")
             return
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False)
+        results = list(self.iter_results(exclude=SCORING_ONLY_FIELDS))
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
         print(f"Results exported to {filename}")
     
     def generate_comparison_report(self) -> str:
         """Generate a comparative analysis report"""
-        if not self.results:
+        if not self.columns['url']:
             return "No results available"
         
-        successful = [r for r in self.results if r.get('status') == 'success']
+        df = self._frame()
+        successful = df[df['status'] == 'success'].reset_index(drop=True)
         
-        if not successful:
+        if successful.empty:
             return "No successful analyses"
         
         report = []
@@ -254,14 +540,15 @@ class BatchSEOAnalyzer:
         report.append("SEO ANALYSIS COMPARISON REPORT")
         report.append("=" * 80)
         report.append(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"Total URLs Analyzed: {len(self.results)}")
+        report.append(f"Total URLs Analyzed: {len(df)}")
         report.append(f"Successful Analyses: {len(successful)}")
         report.append("\n" + "-" * 80)
         
-        # Overall statistics
-        avg_seo = sum(r['seo_score'] for r in successful) / len(successful)
-        avg_loc = sum(r['localization_score'] for r in successful) / len(successful)
-        avg_words = sum(r['word_count'] for r in successful) / len(successful)
+        # Overall statistics (vectorized aggregates over the columns)
+        averages = successful[['seo_score', 'localization_score', 'word_count']].mean()
+        avg_seo = averages['seo_score']
+        avg_loc = averages['localization_score']
+        avg_words = averages['word_count']
         
         report.append("\nOVERALL STATISTICS")
         report.append("-" * 80)
@@ -270,8 +557,8 @@ class BatchSEOAnalyzer:
         report.append(f"Average Word Count: {avg_words:.0f}")
         
         # Best performers
-        best_seo = max(successful, key=lambda x: x['seo_score'])
-        best_loc = max(successful, key=lambda x: x['localization_score'])
+        best_seo = successful.loc[successful['seo_score'].idxmax()]
+        best_loc = successful.loc[successful['localization_score'].idxmax()]
         
         report.append("\n" + "-" * 80)
         report.append("BEST PERFORMERS")
@@ -286,21 +573,21 @@ class BatchSEOAnalyzer:
         report.append("DETAILED URL ANALYSIS")
         report.append("-" * 80)
         
-        for result in successful:
-            report.append(f"\n{result['url']}")
-            report.append(f"  Domain: {result['domain']}")
-            report.append(f"  SEO Score: {result['seo_score']}/100")
-            report.append(f"  Localization Score: {result['localization_score']}/100")
-            report.append(f"  Title Length: {result['title_length']} chars")
-            report.append(f"  Description Length: {result['desc_length']} chars")
-            report.append(f"  Word Count: {result['word_count']}")
-            report.append(f"  Internal Links: {result['internal_links']}")
-            report.append(f"  Images (with alt): {result['images_with_alt']}/{result['total_images']}")
+        for result in successful.itertuples(index=False):
+            report.append(f"\n{result.url}")
+            report.append(f"  Domain: {result.domain}")
+            report.append(f"  SEO Score: {result.seo_score}/100")
+            report.append(f"  Localization Score: {result.localization_score}/100")
+            report.append(f"  Title Length: {result.title_length} chars")
+            report.append(f"  Description Length: {result.desc_length} chars")
+            report.append(f"  Word Count: {result.word_count}")
+            report.append(f"  Internal Links: {result.internal_links}")
+            report.append(f"  Images (with alt): {result.images_with_alt}/{result.total_images}")
             report.append(f"  Technical SEO:")
-            report.append(f"    - Viewport: {'✓' if result['has_viewport'] else '✗'}")
-            report.append(f"    - Canonical: {'✓' if result['has_canonical'] else '✗'}")
-            report.append(f"    - Schema: {'✓' if result['has_schema'] else '✗'}")
-            report.append(f"    - Hreflang: {'✓' if result['has_hreflang'] else '✗'}")
+            report.append(f"    - Viewport: {'✓' if result.has_viewport else '✗'}")
+            report.append(f"    - Canonical: {'✓' if result.has_canonical else '✗'}")
+            report.append(f"    - Schema: {'✓' if result.has_schema else '✗'}")
+            report.append(f"    - Hreflang: {'✓' if result.has_hreflang else '✗'}")
         
         report.append("\n" + "=" * 80)
         
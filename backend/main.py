@@ -3,20 +3,28 @@ Professional Portfolio Backend - SEO Metadata Analyzer
 FastAPI application for extracting and analyzing SEO metadata from URLs
 """
 import uvicorn
+import asyncio
 import logging
 import os
 import re
-import requests
+import codecs
+import httpx
+from dataclasses import fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, HttpUrl
-from bs4 import BeautifulSoup
+from pydantic import BaseModel, ConfigDict, HttpUrl
+import lxml.etree
+import lxml.html
 from dotenv import load_dotenv
 
+import scoring
+from scoring import PageMetrics
+
 # 1. Load environment variables correctly
 env_path = Path(__file__).resolve().parent.parent / '.env'
 load_dotenv(dotenv_path=env_path)
@@ -43,12 +51,82 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def create_http_client() -> httpx.AsyncClient:
+    """Create a pooled async HTTP client shared by all analyzer requests"""
+    transport = httpx.AsyncHTTPTransport(
+        retries=2,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        headers={'User-Agent': 'Mozilla/5.0 (compatible; SEOAnalyzer/1.0)'},
+        timeout=10,
+        follow_redirects=True
+    )
+
+@app.on_event("startup")
+async def startup_event():
+    """Open the shared HTTP client"""
+    app.state.http_client = create_http_client()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared HTTP client"""
+    await app.state.http_client.aclose()
+
+# /analyze rejects pages whose body grows past this while streaming
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+def detect_encoding(content: bytes, charset: Optional[str] = None) -> str:
+    """Pick the page's Python codec: HTTP charset, then <meta charset>, then UTF-8"""
+    encoding = charset
+    if not encoding:
+        match = _META_CHARSET_RE.search(content[:4096])
+        if match:
+            encoding = match.group(1).decode('ascii')
+    
+    try:
+        return codecs.lookup(encoding).name if encoding else 'utf-8'
+    except LookupError:
+        return 'utf-8'
+
+# Elements whose text is never visible page content
+_NON_TEXT_TAGS = frozenset({'script', 'style', 'noscript'})
+
+# Localization signals, compiled once and matched per text chunk
+_ARABIC_RE = re.compile(r'[\u0600-\u06FF]')
+_BILINGUAL_RE = re.compile(r'arabic|عربي|bilingual|multilingual', re.IGNORECASE)
+
+@lru_cache(maxsize=1024)
+def _netloc(url: str) -> str:
+    """Host part of a URL, memoized since the same sites get analyzed repeatedly"""
+    return urlparse(url).netloc
+
+# lxml rejects str input that starts with an XML encoding declaration
+_XML_DECL_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+@lru_cache(maxsize=1)
+def get_html_parser() -> lxml.html.HTMLParser:
+    """Return a reusable lxml HTML parser for already-decoded pages"""
+    # Whitespace-only text, comments and PIs are never read, so drop them at parse time
+    return lxml.html.HTMLParser(
+        remove_blank_text=True,
+        remove_comments=True,
+        remove_pis=True,
+        huge_tree=False
+    )
+
 class URLRequest(BaseModel):
     """Request model for URL analysis"""
     url: HttpUrl
 
 class SEOMetadata(BaseModel):
     """Response model for SEO analysis"""
+    # Built from our own extracted values, so it is constructed without re-validation
+    model_config = ConfigDict(validate_assignment=False, extra='ignore')
+    
     url: str
     title: Optional[str]
     meta_description: Optional[str]
@@ -74,260 +152,202 @@ class SEOMetadata(BaseModel):
 class SEOAnalyzer:
     """Core SEO analysis engine"""
     
-    def __init__(self, url: str):
+    def __init__(self, url: str, client: Optional[httpx.AsyncClient] = None):
         self.url = url
-        self.soup = None
-        self.text_content = ""
+        self.client = client
+        self.content = b""
+        self.encoding = 'utf-8'
+        self.tree = None
         
-    def fetch_page(self) -> bool:
-        """Fetch and parse the webpage"""
+    async def fetch_page(self) -> bool:
+        """Fetch the webpage"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (compatible; SEOAnalyzer/1.0)'
-            }
-            response = requests.get(self.url, headers=headers, timeout=10)
-            response.raise_for_status()
-            self.soup = BeautifulSoup(response.content, 'html.parser')
-            self.text_content = self.soup.get_text(separator=' ', strip=True)
+            if self.client is not None:
+                await self._download(self.client)
+            else:
+                async with create_http_client() as client:
+                    await self._download(client)
             return True
         except Exception as e:
             logger.error(f"Error fetching {self.url}: {str(e)}")
             return False
     
+    async def _download(self, client: httpx.AsyncClient):
+        """Stream the response body, giving up once it exceeds MAX_PAGE_BYTES"""
+        async with client.stream('GET', self.url) as response:
+            response.raise_for_status()
+            buf = bytearray()
+            async for chunk in response.aiter_bytes(65536):
+                buf.extend(chunk)
+                if len(buf) > MAX_PAGE_BYTES:
+                    raise ValueError('page too large')
+            self.content = bytes(buf)
+            self.encoding = detect_encoding(self.content, response.charset_encoding)
+    
+    def parse_page(self):
+        """Parse the fetched HTML into an lxml tree"""
+        # Decode in Python: libxml2 doesn't know every codec name detect_encoding returns
+        html = _XML_DECL_RE.sub('', self.content.decode(self.encoding, 'replace'), count=1)
+        parser = get_html_parser()
+        try:
+            self.tree = lxml.html.document_fromstring(html, parser=parser)
+        except lxml.etree.ParserError:
+            # Empty or whitespace-only body: analyze it as an empty document
+            self.tree = lxml.html.document_fromstring('<html></html>', parser=parser)
+    
     def extract_title(self) -> Optional[str]:
         """Extract page title"""
-        title_tag = self.soup.find('title')
-        return title_tag.string.strip() if title_tag else None
+        title_tag = self.tree.find('.//title')
+        return title_tag.text_content().strip() if title_tag is not None else None
+    
+    def _extract_meta_content(self, name: str) -> Optional[str]:
+        """Extract the content of the first <meta name=...> tag"""
+        meta = self.tree.xpath('//meta[@name=$name]', name=name)
+        return meta[0].get('content', '').strip() if meta else None
     
     def extract_meta_description(self) -> Optional[str]:
         """Extract meta description"""
-        meta = self.soup.find('meta', attrs={'name': 'description'})
-        return meta.get('content', '').strip() if meta else None
+        return self._extract_meta_content('description')
     
     def extract_meta_keywords(self) -> Optional[str]:
         """Extract meta keywords"""
-        meta = self.soup.find('meta', attrs={'name': 'keywords'})
-        return meta.get('content', '').strip() if meta else None
-    
-    def extract_headings(self) -> tuple:
-        """Extract H1 and H2 tags"""
-        h1_tags = [h1.get_text(strip=True) for h1 in self.soup.find_all('h1')]
-        h2_tags = [h2.get_text(strip=True) for h2 in self.soup.find_all('h2')]
-        return h1_tags, h2_tags
+        return self._extract_meta_content('keywords')
     
-    def analyze_links(self) -> tuple:
-        """Analyze internal and external links"""
-        domain = urlparse(self.url).netloc
-        internal = external = 0
-        
-        for link in self.soup.find_all('a', href=True):
-            href = link['href']
-            if href.startswith('/') or domain in href:
-                internal += 1
-            elif href.startswith('http'):
-                external += 1
-        
-        return internal, external
-    
-    def analyze_images(self) -> tuple:
-        """Analyze image optimization"""
-        images = self.soup.find_all('img')
-        total = len(images)
-        with_alt = len([img for img in images if img.get('alt')])
-        return total, with_alt
-    
-    def extract_lang_attributes(self) -> tuple:
-        """Extract language and hreflang data"""
-        html_tag = self.soup.find('html')
-        lang = html_tag.get('lang') if html_tag else None
-        hreflang = bool(self.soup.find('link', rel='alternate', hreflang=True))
-        return lang, hreflang
-    
-    def extract_og_tags(self) -> Dict[str, str]:
-        """Extract Open Graph tags"""
+    def walk_tree(self) -> dict:
+        """Collect headings, links, images, OG/technical tags and text stats in one DOM pass"""
+        domain = _netloc(self.url)
+        internal_prefixes = ('/', f'http://{domain}', f'https://{domain}', f'//{domain}')
+        h1_tags, h2_tags = [], []
+        internal_links = external_links = 0
+        images_count = images_with_alt = 0
         og_tags = {}
-        for meta in self.soup.find_all('meta', property=re.compile(r'^og:')):
-            prop = meta.get('property', '').replace('og:', '')
-            content = meta.get('content', '')
-            og_tags[prop] = content
-        return og_tags
-    
-    def check_technical_seo(self) -> tuple:
-        """Check technical SEO elements"""
-        # Schema markup
-        schema = bool(self.soup.find('script', type='application/ld+json'))
+        has_hreflang = schema = viewport = has_rtl = False
+        canonical_url = None
+        word_count = 0
+        has_arabic_text = has_bilingual_terms = False
         
-        # Mobile viewport
-        viewport = bool(self.soup.find('meta', attrs={'name': 'viewport'}))
+        for el in self.tree.iter():
+            tag = el.tag
+            
+            # Visible text is element text (outside script/style) plus tail text;
+            # count it chunk by chunk instead of building the full page string
+            if isinstance(tag, str) and tag not in _NON_TEXT_TAGS:
+                chunks = (el.text, el.tail)
+            else:
+                chunks = (el.tail,)
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                word_count += len(chunk.split())
+                if not has_bilingual_terms and _BILINGUAL_RE.search(chunk):
+                    has_bilingual_terms = True
+                if not has_arabic_text and _ARABIC_RE.search(chunk):
+                    has_arabic_text = True
+            
+            if not isinstance(tag, str):
+                # Comments and processing instructions
+                continue
+            
+            if not has_rtl and el.get('dir') == 'rtl':
+                has_rtl = True
+            
+            if tag == 'a':
+                href = el.get('href')
+                if href is None:
+                    continue
+                if href.startswith(internal_prefixes):
+                    internal_links += 1
+                elif href.startswith('http'):
+                    external_links += 1
+            elif tag == 'img':
+                images_count += 1
+                if el.get('alt'):
+                    images_with_alt += 1
+            elif tag == 'h1':
+                h1_tags.append(el.text_content().strip())
+            elif tag == 'h2':
+                h2_tags.append(el.text_content().strip())
+            elif tag == 'meta':
+                prop = el.get('property', '')
+                if prop.startswith('og:'):
+                    og_tags[prop[3:]] = el.get('content', '')
+                elif el.get('name') == 'viewport':
+                    viewport = True
+            elif tag == 'link':
+                rel = el.get('rel', '').lower().split()
+                if 'canonical' in rel and canonical_url is None:
+                    canonical_url = el.get('href')
+                elif 'alternate' in rel and el.get('hreflang') is not None:
+                    has_hreflang = True
+            elif tag == 'script':
+                if el.get('type') == 'application/ld+json':
+                    schema = True
         
-        # Canonical URL
-        canonical = self.soup.find('link', rel='canonical')
-        canonical_url = canonical.get('href') if canonical else None
-        
-        return schema, viewport, canonical_url
-    
-    def calculate_word_count(self) -> int:
-        """Calculate word count from text content"""
-        words = self.text_content.split()
-        return len(words)
+        return {
+            'word_count': word_count,
+            'h1_tags': h1_tags,
+            'h2_tags': h2_tags,
+            'internal_links': internal_links,
+            'external_links': external_links,
+            'images_count': images_count,
+            'images_with_alt': images_with_alt,
+            'has_hreflang': has_hreflang,
+            'og_tags': og_tags,
+            'schema_markup': schema,
+            'mobile_viewport': viewport,
+            'canonical_url': canonical_url,
+            'has_rtl': has_rtl,
+            'has_arabic_text': has_arabic_text,
+            'has_bilingual_terms': has_bilingual_terms,
+        }
     
-    def calculate_seo_score(self, metadata: dict) -> int:
+    def calculate_seo_score(self, metrics: PageMetrics) -> int:
         """Calculate overall SEO score (0-100)"""
-        score = 0
-        
-        # Title optimization (20 points)
-        if metadata['title']:
-            title_len = len(metadata['title'])
-            if 30 <= title_len <= 60:
-                score += 20
-            elif title_len > 0:
-                score += 10
-        
-        # Meta description (15 points)
-        if metadata['meta_description']:
-            desc_len = len(metadata['meta_description'])
-            if 120 <= desc_len <= 160:
-                score += 15
-            elif desc_len > 0:
-                score += 8
-        
-        # H1 tags (10 points)
-        if len(metadata['h1_tags']) == 1:
-            score += 10
-        elif len(metadata['h1_tags']) > 0:
-            score += 5
-        
-        # Images with alt text (10 points)
-        if metadata['images_count'] > 0:
-            alt_ratio = metadata['images_with_alt'] / metadata['images_count']
-            score += int(10 * alt_ratio)
-        
-        # Content length (15 points)
-        if metadata['word_count'] >= 300:
-            score += 15
-        elif metadata['word_count'] >= 150:
-            score += 8
-        
-        # Technical SEO (30 points)
-        if metadata['mobile_viewport']:
-            score += 10
-        if metadata['canonical_url']:
-            score += 10
-        if metadata['schema_markup']:
-            score += 10
-        
-        return min(score, 100)
+        return scoring.calculate_seo_score(metrics)
     
-    def calculate_localization_score(self, metadata: dict) -> int:
+    def calculate_localization_score(self, metrics: PageMetrics) -> int:
         """Calculate localization quality score (0-100)"""
-        score = 0
-        
-        # Language attribute (25 points)
-        if metadata['lang_attribute']:
-            score += 25
-        
-        # Hreflang implementation (25 points)
-        if metadata['has_hreflang']:
-            score += 25
-        
-        # Bilingual content indicators (30 points)
-        text_lower = self.text_content.lower()
-        if any(word in text_lower for word in ['arabic', 'عربي', 'bilingual', 'multilingual']):
-            score += 15
-        
-        # Check for RTL support or Arabic content
-        if self.soup.find(attrs={'dir': 'rtl'}) or bool(re.search(r'[\u0600-\u06FF]', self.text_content)):
-            score += 15
-        
-        # OG locale tags (20 points)
-        if 'locale' in metadata['og_tags']:
-            score += 20
-        
-        return min(score, 100)
+        return scoring.calculate_localization_score(metrics)
     
-    def calculate_content_density(self, metadata: dict) -> int:
+    def calculate_content_density(self, metrics: PageMetrics) -> int:
         """Calculate content density score (0-100)"""
-        score = 0
-        
-        # Word count (40 points)
-        wc = metadata['word_count']
-        if wc >= 1000:
-            score += 40
-        elif wc >= 500:
-            score += 30
-        elif wc >= 200:
-            score += 20
-        
-        # Heading structure (30 points)
-        if len(metadata['h1_tags']) > 0 and len(metadata['h2_tags']) > 0:
-            score += 30
-        elif len(metadata['h1_tags']) > 0 or len(metadata['h2_tags']) > 0:
-            score += 15
-        
-        # Internal linking (30 points)
-        if metadata['internal_links'] >= 10:
-            score += 30
-        elif metadata['internal_links'] >= 5:
-            score += 20
-        elif metadata['internal_links'] > 0:
-            score += 10
-        
-        return min(score, 100)
+        return scoring.calculate_content_density(metrics)
     
-    def calculate_technical_seo_score(self, metadata: dict) -> int:
+    def calculate_technical_seo_score(self, metrics: PageMetrics) -> int:
         """Calculate technical SEO score (0-100)"""
-        score = 0
-        
-        if metadata['mobile_viewport']:
-            score += 25
-        if metadata['canonical_url']:
-            score += 25
-        if metadata['schema_markup']:
-            score += 25
-        if len(metadata['og_tags']) >= 3:
-            score += 25
-        
-        return score
+        return scoring.calculate_technical_seo_score(metrics)
     
-    def analyze(self) -> SEOMetadata:
+    async def analyze(self) -> SEOMetadata:
         """Perform complete SEO analysis"""
-        if not self.fetch_page():
+        if not await self.fetch_page():
             raise Exception("Failed to fetch page")
         
-        # Extract all metadata
-        h1_tags, h2_tags = self.extract_headings()
-        internal_links, external_links = self.analyze_links()
-        images_count, images_with_alt = self.analyze_images()
-        lang_attr, has_hreflang = self.extract_lang_attributes()
-        schema, viewport, canonical = self.check_technical_seo()
+        # Parsing and scoring are CPU-bound; keep them off the event loop
+        return await asyncio.to_thread(self.extract_metadata)
+    
+    def extract_metadata(self) -> SEOMetadata:
+        """Parse the fetched page and build the scored metadata"""
+        self.parse_page()
         
-        metadata = {
-            'url': self.url,
-            'title': self.extract_title(),
-            'meta_description': self.extract_meta_description(),
-            'meta_keywords': self.extract_meta_keywords(),
-            'h1_tags': h1_tags,
-            'h2_tags': h2_tags,
-            'internal_links': internal_links,
-            'external_links': external_links,
-            'images_count': images_count,
-            'images_with_alt': images_with_alt,
-            'word_count': self.calculate_word_count(),
-            'lang_attribute': lang_attr,
-            'has_hreflang': has_hreflang,
-            'og_tags': self.extract_og_tags(),
-            'schema_markup': schema,
-            'mobile_viewport': viewport,
-            'canonical_url': canonical,
-        }
+        # Extract all metadata
+        metrics = PageMetrics(
+            url=self.url,
+            title=self.extract_title(),
+            meta_description=self.extract_meta_description(),
+            meta_keywords=self.extract_meta_keywords(),
+            lang_attribute=self.tree.get('lang'),
+            **self.walk_tree()
+        )
         
         # Calculate scores
-        metadata['seo_score'] = self.calculate_seo_score(metadata)
-        metadata['localization_score'] = self.calculate_localization_score(metadata)
-        metadata['content_density'] = self.calculate_content_density(metadata)
-        metadata['technical_seo_score'] = self.calculate_technical_seo_score(metadata)
+        metadata = {f.name: getattr(metrics, f.name) for f in fields(PageMetrics)}
+        metadata['seo_score'] = self.calculate_seo_score(metrics)
+        metadata['localization_score'] = self.calculate_localization_score(metrics)
+        metadata['content_density'] = self.calculate_content_density(metrics)
+        metadata['technical_seo_score'] = self.calculate_technical_seo_score(metrics)
         
-        return SEOMetadata(**metadata)
+        # Trusted internal payload: validation only happens at the request boundary
+        return SEOMetadata.model_construct(**metadata)
 
 @app.get("/")
 async def root():
@@ -358,8 +378,8 @@ async def analyze_url(request: URLRequest):
         SEOMetadata: Complete SEO analysis results
     """
     try:
-        analyzer = SEOAnalyzer(str(request.url))
-        results = analyzer.analyze()
+        analyzer = SEOAnalyzer(str(request.url), client=app.state.http_client)
+        results = await analyzer.analyze()
         logger.info(f"Successfully analyzed: {request.url}")
         return results
     except Exception as e:
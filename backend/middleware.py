@@ -1,50 +1,70 @@
-rom functools import wraps
+from functools import wraps
 from flask import request, jsonify
-from datetime import datetime, timedelta
 import re
-from collections import defaultdict
+import time
+from collections import defaultdict, deque
 import threading
 
+# Number of independently locked rate-limiter stripes (must be a power of two)
+RATE_LIMIT_SHARDS = 64
+
+# Basic URL validation, compiled once at import
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
+    r'localhost|'  # localhost
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # or IP
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+# Translation table deleting the characters stripped for basic XSS prevention
+_XSS_TABLE = str.maketrans('', '', '<>')
+
 class RateLimiter:
-    """Thread-safe rate limiter"""
-    def _init_(self, max_requests=60, window_seconds=60):
+    """Thread-safe sliding-window rate limiter"""
+    def __init__(self, max_requests=60, window_seconds=60):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = defaultdict(list)
-        self.lock = threading.Lock()
+        # Per-identifier request times (monotonic seconds), oldest on the left,
+        # striped across shards so different clients don't contend on one lock
+        self.shards = [(defaultdict(deque), threading.Lock()) for _ in range(RATE_LIMIT_SHARDS)]
+    
+    def _shard(self, identifier):
+        """Return the (requests, lock) stripe owning identifier"""
+        return self.shards[hash(identifier) & (RATE_LIMIT_SHARDS - 1)]
+    
+    def _evict(self, timestamps, now):
+        """Drop timestamps that have left the window"""
+        cutoff = now - self.window_seconds
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
     
     def is_allowed(self, identifier):
-        """Check if request is allowed"""
-        with self.lock:
-            now = datetime.now()
-            cutoff = now - timedelta(seconds=self.window_seconds)
-            
-            # Clean old requests
-            self.requests[identifier] = [
-                req_time for req_time in self.requests[identifier]
-                if req_time > cutoff
-            ]
+        """Check if request is allowed; returns (allowed, remaining requests in the window)"""
+        requests, lock = self._shard(identifier)
+        with lock:
+            now = time.monotonic()
+            timestamps = requests[identifier]
+            self._evict(timestamps, now)
             
             # Check limit
-            if len(self.requests[identifier]) >= self.max_requests:
-                return False
+            if len(timestamps) >= self.max_requests:
+                return False, 0
             
             # Add current request
-            self.requests[identifier].append(now)
-            return True
+            timestamps.append(now)
+            return True, self.max_requests - len(timestamps)
     
     def get_remaining(self, identifier):
         """Get remaining requests"""
-        with self.lock:
-            now = datetime.now()
-            cutoff = now - timedelta(seconds=self.window_seconds)
+        requests, lock = self._shard(identifier)
+        with lock:
+            timestamps = requests.get(identifier)
+            if not timestamps:
+                return self.max_requests
             
-            recent_requests = [
-                req_time for req_time in self.requests.get(identifier, [])
-                if req_time > cutoff
-            ]
-            
-            return max(0, self.max_requests - len(recent_requests))
+            self._evict(timestamps, time.monotonic())
+            return max(0, self.max_requests - len(timestamps))
 
 # Global rate limiter instance
 rate_limiter = None
@@ -68,8 +88,8 @@ def rate_limit(f):
         # Get identifier (IP address)
         identifier = request.remote_addr
         
-        if not rate_limiter.is_allowed(identifier):
-            remaining = rate_limiter.get_remaining(identifier)
+        allowed, remaining = rate_limiter.is_allowed(identifier)
+        if not allowed:
             return jsonify({
                 'error': 'Rate limit exceeded',
                 'message': 'Too many requests. Please try again later.',
@@ -106,11 +126,11 @@ def validate_input(required_fields=None, max_lengths=None):
                             'message': f'{field} exceeds maximum length of {max_len}'
                         }), 400
             
-            # Sanitize inputs (basic XSS prevention)
+            # Sanitize inputs (basic XSS prevention); clean values are left untouched
             for key, value in data.items():
-                if isinstance(value, str):
+                if isinstance(value, str) and ('<' in value or '>' in value):
                     # Remove potentially dangerous characters
-                    data[key] = re.sub(r'[<>]', '', value)
+                    data[key] = value.translate(_XSS_TABLE)
             
             request.validated_data = data
             return f(*args, **kwargs)
@@ -123,16 +143,7 @@ def sanitize_url(url):
     if not url:
         return None
     
-    # Basic URL validation
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-        r'localhost|'  # localhost
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # or IP
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    
-    if not url_pattern.match(url):
+    if not _URL_RE.match(url):
         raise ValueError('Invalid URL format')
     
     return url
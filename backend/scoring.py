@@ -0,0 +1,140 @@
+"""
+SEO scoring functions for the analyzer API
+Pure integer/boolean arithmetic over extracted page metrics, kept free of
+parsing and I/O so mypyc can compile it to a C extension (see setup.py)
+"""
+import sys
+from dataclasses import dataclass
+from typing import Dict, Final, List, Optional, Tuple
+
+Tiers = Tuple[Tuple[int, int, int], ...]
+
+# Score tiers as (lower, upper, points), inclusive bounds; the first matching tier wins
+_UNBOUNDED: Final = sys.maxsize
+TITLE_LENGTH_TIERS: Final[Tiers] = ((30, 60, 20), (1, _UNBOUNDED, 10))
+DESCRIPTION_LENGTH_TIERS: Final[Tiers] = ((120, 160, 15), (1, _UNBOUNDED, 8))
+H1_COUNT_TIERS: Final[Tiers] = ((1, 1, 10), (2, _UNBOUNDED, 5))
+SEO_WORD_COUNT_TIERS: Final[Tiers] = ((300, _UNBOUNDED, 15), (150, _UNBOUNDED, 8))
+DENSITY_WORD_COUNT_TIERS: Final[Tiers] = ((1000, _UNBOUNDED, 40), (500, _UNBOUNDED, 30), (200, _UNBOUNDED, 20))
+INTERNAL_LINK_TIERS: Final[Tiers] = ((10, _UNBOUNDED, 30), (5, _UNBOUNDED, 20), (1, _UNBOUNDED, 10))
+
+@dataclass(slots=True)
+class PageMetrics:
+    """Extracted page signals consumed by the scoring functions"""
+    url: str
+    title: Optional[str]
+    meta_description: Optional[str]
+    meta_keywords: Optional[str]
+    lang_attribute: Optional[str]
+    word_count: int
+    h1_tags: List[str]
+    h2_tags: List[str]
+    internal_links: int
+    external_links: int
+    images_count: int
+    images_with_alt: int
+    has_hreflang: bool
+    og_tags: Dict[str, str]
+    schema_markup: bool
+    mobile_viewport: bool
+    canonical_url: Optional[str]
+    has_rtl: bool
+    has_arabic_text: bool
+    has_bilingual_terms: bool
+
+def tier_points(value: int, tiers: Tiers) -> int:
+    """Return the points of the first tier whose bounds contain value"""
+    for lower, upper, points in tiers:
+        if lower <= value <= upper:
+            return points
+    return 0
+
+def calculate_seo_score(metrics: PageMetrics) -> int:
+    """Calculate overall SEO score (0-100)"""
+    score = 0
+    
+    # Title optimization (20 points)
+    score += tier_points(len(metrics.title or ''), TITLE_LENGTH_TIERS)
+    
+    # Meta description (15 points)
+    score += tier_points(len(metrics.meta_description or ''), DESCRIPTION_LENGTH_TIERS)
+    
+    # H1 tags (10 points)
+    score += tier_points(len(metrics.h1_tags), H1_COUNT_TIERS)
+    
+    # Images with alt text (10 points)
+    if metrics.images_count > 0:
+        alt_ratio = metrics.images_with_alt / metrics.images_count
+        score += int(10 * alt_ratio)
+    
+    # Content length (15 points)
+    score += tier_points(metrics.word_count, SEO_WORD_COUNT_TIERS)
+    
+    # Technical SEO (30 points)
+    if metrics.mobile_viewport:
+        score += 10
+    if metrics.canonical_url:
+        score += 10
+    if metrics.schema_markup:
+        score += 10
+    
+    return min(score, 100)
+
+def calculate_localization_score(metrics: PageMetrics) -> int:
+    """Calculate localization quality score (0-100)"""
+    score = 0
+    
+    # Language attribute (25 points)
+    if metrics.lang_attribute:
+        score += 25
+    
+    # Hreflang implementation (25 points)
+    if metrics.has_hreflang:
+        score += 25
+    
+    # Bilingual content indicators (30 points)
+    if metrics.has_bilingual_terms:
+        score += 15
+    
+    # Check for RTL support or Arabic content
+    if metrics.has_rtl or metrics.has_arabic_text:
+        score += 15
+    
+    # OG locale tags (20 points)
+    if 'locale' in metrics.og_tags:
+        score += 20
+    
+    return min(score, 100)
+
+def calculate_content_density(metrics: PageMetrics) -> int:
+    """Calculate content density score (0-100)"""
+    score = 0
+    
+    # Word count (40 points)
+    score += tier_points(metrics.word_count, DENSITY_WORD_COUNT_TIERS)
+    
+    # Heading structure (30 points)
+    if len(metrics.h1_tags) > 0 and len(metrics.h2_tags) > 0:
+        score += 30
+    elif len(metrics.h1_tags) > 0 or len(metrics.h2_tags) > 0:
+        score += 15
+    
+    # Internal linking (30 points)
+    score += tier_points(metrics.internal_links, INTERNAL_LINK_TIERS)
+    
+    return min(score, 100)
+
+def calculate_technical_seo_score(metrics: PageMetrics) -> int:
+    """Calculate technical SEO score (0-100)"""
+    score = 0
+    
+    if metrics.mobile_viewport:
+        score += 25
+    if metrics.canonical_url:
+        score += 25
+    if metrics.schema_markup:
+        score += 25
+    if len(metrics.og_tags) >= 3:
+        score += 25
+    
+    return score
@@ -5,17 +5,30 @@ Integrates: Ahrefs, Screaming Frog, SurferSEO, Lighthouse, Google Trends
 
 import os
 import json
-import subprocess
-import requests
+import asyncio
+import aiohttp
+import numpy as np
 import pandas as pd
+import zstandard
+from diskcache import Cache
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON codec
+    orjson = None
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 import logging
 from pathlib import Path
 from pytrends.request import TrendReq
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from urllib.parse import urlparse
 import statistics
+import threading
+from collections import deque
 
 # Configure logging
 logging.basicConfig(
@@ -24,7 +37,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class SEODataPoint:
     """Unified data structure for SEO metrics"""
     timestamp: str
@@ -42,20 +55,136 @@ class SEODataPoint:
     trend_score: Optional[float] = None
     trend_data: Optional[List[Dict]] = None
     metadata: Optional[Dict] = None
+    timestamp_epoch: Optional[int] = None
+
+@lru_cache(maxsize=1024)
+def _netloc(url: str) -> str:
+    """Host part of a URL, memoized since multi-URL runs repeat the same domains"""
+    return urlparse(url).netloc
+
+# Bounded stderr capture for CLI tools (the tail kept for error messages)
+STDERR_CHUNK_SIZE = 4096
+STDERR_TAIL_CHUNKS = 16
+
+async def run_command(command: List[str], timeout: float, capture_stdout: bool = True) -> Tuple[bytes, Optional[bytes]]:
+    """Run a CLI tool without blocking the event loop; stderr is None on a zero exit"""
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE
+    )
+    
+    # Progress output is logged as it arrives, keeping only a bounded tail for errors
+    stderr_tail = deque(maxlen=STDERR_TAIL_CHUNKS)
+    
+    async def drain_stderr():
+        while chunk := await process.stderr.read(STDERR_CHUNK_SIZE):
+            logger.debug(f"{command[0]}: {chunk.decode(errors='replace').rstrip()}")
+            stderr_tail.append(chunk)
+    
+    async def read_stdout() -> bytes:
+        return await process.stdout.read() if capture_stdout else b""
+    
+    try:
+        stdout, _, _ = await asyncio.wait_for(
+            asyncio.gather(read_stdout(), drain_stderr(), process.wait()),
+            timeout
+        )
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+    
+    return stdout, (b"".join(stderr_tail) if process.returncode != 0 else None)
+
+def json_loads(data):
+    """Decode JSON from bytes or str, preferring orjson"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def json_dumps_line(obj) -> bytes:
+    """Encode obj as one compact, newline-terminated JSON line"""
+    if orjson is not None:
+        # Match stdlib behaviour for int dict keys and numpy scalars from pandas
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return (json.dumps(obj, separators=(',', ':')) + '\n').encode('utf-8')
+
+# External API / audit results are reused for an hour
+CACHE_DIR = './seo_cache'
+CACHE_TTL_SECONDS = 3600
+
+def cache_get(cache: Optional[Cache], key: Tuple):
+    """Return a cached extractor result, or None on a miss (or with no cache)"""
+    return cache.get(key) if cache is not None else None
+
+def cache_set(cache: Optional[Cache], key: Tuple, value: Dict):
+    """Store a successful extractor result for CACHE_TTL_SECONDS"""
+    if cache is not None:
+        cache.set(key, value, expire=CACHE_TTL_SECONDS)
+
+class PooledHTTPExtractor:
+    """Base for API extractors sharing one keep-alive aiohttp session across calls"""
+    
+    headers: Dict[str, str] = {}
+    _session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Open the pooled session on first use (it must be created inside the event loop)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=60)
+            )
+        return self._session
+    
+    # Connection failures and timeouts are retried; HTTP error statuses are not
+    @retry(
+        retry=retry_if_exception_type((aiohttp.ClientConnectionError, asyncio.TimeoutError)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.3),
+        reraise=True
+    )
+    async def _request_json(self, method: str, endpoint: str, **kwargs) -> Dict:
+        """Send a request on the pooled session and decode the JSON body"""
+        async with self._get_session().request(method, endpoint, **kwargs) as response:
+            response.raise_for_status()
+            return json_loads(await response.read())
+    
+    async def close(self):
+        """Close the pooled session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
-class AhrefsExtractor:
+class AhrefsExtractor(PooledHTTPExtractor):
     """Extract data from Ahrefs API v3"""
     
-    def __init__(self, api_token: str):
+    def __init__(self, api_token: str, cache: Optional[Cache] = None):
         self.api_token = api_token
+        self.cache = cache
+        # Domain metrics fetched by this process; URLs on one domain share a single call
+        self._domain_metrics: Dict[str, Dict] = {}
         self.base_url = "https://api.ahrefs.com/v3"
         self.headers = {
             "Authorization": f"Bearer {api_token}",
             "Content-Type": "application/json"
         }
     
-    def get_domain_metrics(self, domain: str) -> Dict:
+    async def get_domain_metrics(self, domain: str) -> Dict:
         """Fetch domain rating and backlink metrics"""
+        if domain in self._domain_metrics:
+            return self._domain_metrics[domain]
+        
+        cache_key = ('ahrefs', domain)
+        cached = cache_get(self.cache, cache_key)
+        if cached is not None:
+            logger.info(f"Ahrefs: Using cached metrics for {domain}")
+            self._domain_metrics[domain] = cached
+            return cached
+        
         try:
             endpoint = f"{self.base_url}/site-explorer/domain-rating"
             params = {
@@ -63,14 +192,7 @@ class AhrefsExtractor:
                 "mode": "domain"
             }
             
-            response = requests.get(
-                endpoint, 
-                headers=self.headers, 
-                params=params,
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = await self._request_json('GET', endpoint, params=params)
             
             # Extract metrics
             metrics = {
@@ -81,24 +203,56 @@ class AhrefsExtractor:
             }
             
             logger.info(f"Ahrefs: Successfully fetched metrics for {domain}")
+            cache_set(self.cache, cache_key, metrics)
+            self._domain_metrics[domain] = metrics
             return metrics
             
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Ahrefs API error for {domain}: {str(e)}")
             return {}
         except Exception as e:
             logger.error(f"Unexpected error in Ahrefs extraction: {str(e)}")
             return {}
 
+# Only these columns of the Screaming Frog "Internal" export are used
+SF_COLUMN_DTYPES = {
+    'Status Code': 'Int32',
+    'Meta Description 1': 'object',
+    'H1-1': 'object',
+    'Response Time': 'float64'
+}
+SF_ERROR_STATUS_CODES = [404, 500, 503]
+SF_REQUIRED_TEXT_COLUMNS = ['Meta Description 1', 'H1-1']
+# Rows per read_csv chunk, and the initial capacity of the reusable parse buffers
+SF_CSV_CHUNK_ROWS = 50_000
+SF_DEFAULT_MAX_URLS = 50_000
+
 class ScreamingFrogExtractor:
     """Extract technical SEO data from Screaming Frog Spider"""
     
-    def __init__(self, cli_path: str = "screamingfrogseospider"):
+    def __init__(self, cli_path: str = "screamingfrogseospider", max_urls: int = SF_DEFAULT_MAX_URLS):
         self.cli_path = cli_path
         self.output_folder = Path("./screaming_frog_exports")
         self.output_folder.mkdir(exist_ok=True)
+        
+        # Column buffers reused by every parse instead of allocating per crawl;
+        # the lock keeps concurrent parses (they run in worker threads) apart
+        self._status_buf = np.empty(max_urls, dtype=np.int64)
+        self._response_buf = np.empty(max_urls, dtype=np.float64)
+        self._buf_lock = threading.Lock()
     
-    def crawl_site(self, url: str, max_crawl_depth: int = 3) -> Dict:
+    def _reserve(self, rows: int):
+        """Grow the parse buffers (doubling) when a crawl exceeds their capacity"""
+        if rows <= len(self._status_buf):
+            return
+        capacity = max(rows, 2 * len(self._status_buf))
+        status_buf = np.empty(capacity, dtype=np.int64)
+        response_buf = np.empty(capacity, dtype=np.float64)
+        status_buf[:len(self._status_buf)] = self._status_buf
+        response_buf[:len(self._response_buf)] = self._response_buf
+        self._status_buf, self._response_buf = status_buf, response_buf
+    
+    async def crawl_site(self, url: str, max_crawl_depth: int = 3) -> Dict:
         """Trigger Screaming Frog CLI crawl and parse results"""
         try:
             logger.info(f"Starting Screaming Frog crawl for {url}")
@@ -118,22 +272,18 @@ class ScreamingFrogExtractor:
                 "--crawl-images", "false"  # Speed optimization
             ]
             
-            # Execute crawl
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minute timeout
-            )
+            # Execute crawl without blocking the other extractors
+            # Only the exported CSVs matter; the crawl log on stdout is discarded
+            _, stderr = await run_command(command, timeout=600, capture_stdout=False)  # 10 minute timeout
             
-            if result.returncode != 0:
-                logger.error(f"Screaming Frog crawl failed: {result.stderr}")
+            if stderr is not None:
+                logger.error(f"Screaming Frog crawl failed: {stderr.decode(errors='replace')}")
                 return self._get_mock_data()
             
             # Parse exported CSV files
-            return self._parse_crawl_results(output_path)
+            return await asyncio.to_thread(self._parse_crawl_results, output_path)
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             logger.error("Screaming Frog crawl timeout")
             return self._get_mock_data()
         except FileNotFoundError:
@@ -152,43 +302,81 @@ class ScreamingFrogExtractor:
                 logger.warning("No CSV files found in output")
                 return self._get_mock_data()
             
-            df = pd.read_csv(csv_files[0])
-            
-            # Calculate technical health metrics
-            total_urls = len(df)
-            status_codes = df['Status Code'].value_counts().to_dict() if 'Status Code' in df else {}
-            
-            errors = sum([
-                status_codes.get(404, 0),
-                status_codes.get(500, 0),
-                status_codes.get(503, 0)
-            ])
-            
-            # Calculate health score (0-100)
-            error_rate = errors / total_urls if total_urls > 0 else 0
-            health_score = max(0, 100 - (error_rate * 100))
-            
-            # Additional metrics
-            missing_meta_desc = df['Meta Description 1'].isna().sum() if 'Meta Description 1' in df else 0
-            missing_h1 = df['H1-1'].isna().sum() if 'H1-1' in df else 0
+            with self._buf_lock:
+                metrics = self._aggregate_crawl_csv(csv_files[0])
             
-            metrics = {
-                'technical_health_score': round(health_score, 2),
-                'total_urls_crawled': total_urls,
-                'crawl_errors': errors,
-                'status_code_breakdown': status_codes,
-                'missing_meta_descriptions': int(missing_meta_desc),
-                'missing_h1_tags': int(missing_h1),
-                'avg_response_time': df['Response Time'].mean() if 'Response Time' in df else 0
-            }
-            
-            logger.info(f"Screaming Frog: Parsed {total_urls} URLs, Health Score: {health_score}")
+            logger.info(
+                f"Screaming Frog: Parsed {metrics['total_urls_crawled']} URLs, "
+                f"Health Score: {metrics['technical_health_score']}"
+            )
             return metrics
             
         except Exception as e:
             logger.error(f"Error parsing Screaming Frog results: {str(e)}")
             return self._get_mock_data()
     
+    def _aggregate_crawl_csv(self, csv_file: Path) -> Dict:
+        """Stream the export in chunks into the reusable buffers and compute crawl metrics"""
+        total_urls = 0
+        columns = pd.Index([])
+        missing_meta_desc = missing_h1 = 0
+        
+        # Skip the dozens of unused columns; a callable tolerates exports missing one
+        chunks = pd.read_csv(
+            csv_file,
+            usecols=lambda column: column in SF_COLUMN_DTYPES,
+            dtype=SF_COLUMN_DTYPES,
+            chunksize=SF_CSV_CHUNK_ROWS
+        )
+        for chunk in chunks:
+            rows = len(chunk)
+            end = total_urls + rows
+            self._reserve(end)
+            columns = chunk.columns
+            
+            if 'Status Code' in chunk:
+                self._status_buf[total_urls:end] = chunk['Status Code'].to_numpy(dtype=np.int64, na_value=-1)
+            if 'Response Time' in chunk:
+                self._response_buf[total_urls:end] = chunk['Response Time'].to_numpy(dtype=np.float64, na_value=np.nan)
+            
+            # Both text columns counted in a single isna pass
+            missing = chunk[chunk.columns.intersection(SF_REQUIRED_TEXT_COLUMNS)].isna().sum()
+            missing_meta_desc += int(missing.get('Meta Description 1', 0))
+            missing_h1 += int(missing.get('H1-1', 0))
+            total_urls = end
+        
+        # Calculate technical health metrics
+        if 'Status Code' in columns:
+            # One numpy pass: per-code counts, from which the error total is derived
+            codes = self._status_buf[:total_urls]
+            values, counts = np.unique(codes[codes >= 0], return_counts=True)
+            errors = int(counts[np.isin(values, SF_ERROR_STATUS_CODES)].sum())
+            order = np.argsort(-counts, kind='stable')
+            status_codes = dict(zip(values[order].tolist(), counts[order].tolist()))
+        else:
+            errors = 0
+            status_codes = {}
+        
+        # Calculate health score (0-100)
+        error_rate = errors / total_urls if total_urls > 0 else 0
+        health_score = max(0, 100 - (error_rate * 100))
+        
+        avg_response_time = 0
+        if 'Response Time' in columns:
+            times = self._response_buf[:total_urls]
+            times = times[~np.isnan(times)]
+            avg_response_time = float(times.mean()) if times.size else 0
+        
+        return {
+            'technical_health_score': round(health_score, 2),
+            'total_urls_crawled': total_urls,
+            'crawl_errors': errors,
+            'status_code_breakdown': status_codes,
+            'missing_meta_descriptions': missing_meta_desc,
+            'missing_h1_tags': missing_h1,
+            'avg_response_time': avg_response_time
+        }
+    
     def _get_mock_data(self) -> Dict:
         """Return mock data when Screaming Frog is unavailable"""
         return {
@@ -201,36 +389,35 @@ class ScreamingFrogExtractor:
             'avg_response_time': 245
         }
 
-class SurferSEOExtractor:
+class SurferSEOExtractor(PooledHTTPExtractor):
     """Extract content score from SurferSEO API"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache: Optional[Cache] = None):
         self.api_key = api_key
+        self.cache = cache
         self.base_url = "https://api.surferseo.com/v1"
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
     
-    def get_content_score(self, url: str, keyword: str) -> Dict:
+    async def get_content_score(self, url: str, keyword: str) -> Dict:
         """Fetch SurferSEO content score for URL and keyword"""
+        cache_key = ('surfer', url, keyword)
+        cached = cache_get(self.cache, cache_key)
+        if cached is not None:
+            logger.info(f"SurferSEO: Using cached content score for {url}")
+            return cached
+        
         try:
             endpoint = f"{self.base_url}/content-editor/audit"
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "url": url,
                 "keyword": keyword
             }
             
-            response = requests.post(
-                endpoint,
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = await self._request_json('POST', endpoint, json=payload)
             
             metrics = {
                 'content_score': data.get('content_score', 0),
@@ -241,9 +428,10 @@ class SurferSEOExtractor:
             }
             
             logger.info(f"SurferSEO: Content score {metrics['content_score']} for {url}")
+            cache_set(self.cache, cache_key, metrics)
             return metrics
             
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"SurferSEO API error: {str(e)}")
             # Return mock data for development
             return {
@@ -260,41 +448,38 @@ class SurferSEOExtractor:
 class LighthouseExtractor:
     """Extract performance metrics from Google Lighthouse"""
     
-    def __init__(self):
-        self.output_folder = Path("./lighthouse_reports")
-        self.output_folder.mkdir(exist_ok=True)
+    def __init__(self, cache: Optional[Cache] = None):
+        self.cache = cache
     
-    def run_audit(self, url: str) -> Dict:
+    async def run_audit(self, url: str) -> Dict:
         """Run Lighthouse audit and extract scores"""
+        # Audits are bucketed by hour, so at most one runs per URL per hour
+        cache_key = ('lighthouse', url, datetime.now().strftime('%Y-%m-%dT%H'))
+        cached = cache_get(self.cache, cache_key)
+        if cached is not None:
+            logger.info(f"Lighthouse: Using cached audit for {url}")
+            return cached
+        
         try:
             logger.info(f"Running Lighthouse audit for {url}")
             
-            output_file = self.output_folder / f"report_{int(time.time())}.json"
-            
-            # Lighthouse CLI command
+            # Lighthouse CLI command; the JSON report is written to stdout
             command = [
                 "lighthouse",
                 url,
                 "--output=json",
-                f"--output-path={output_file}",
-                "--chrome-flags='--headless'",
+                "--chrome-flags=--headless",
                 "--quiet"
             ]
             
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            stdout, stderr = await run_command(command, timeout=120)
             
-            if result.returncode != 0 or not output_file.exists():
+            if stderr is not None or not stdout:
                 logger.warning("Lighthouse CLI unavailable, using mock data")
                 return self._get_mock_lighthouse_data()
             
-            # Parse JSON report
-            with open(output_file, 'r') as f:
-                report = json.load(f)
+            # Parse JSON report straight from the pipe
+            report = json_loads(stdout)
             
             categories = report.get('categories', {})
             
@@ -309,9 +494,10 @@ class LighthouseExtractor:
             }
             
             logger.info(f"Lighthouse: Performance {metrics['lighthouse_performance']}, SEO {metrics['lighthouse_seo']}")
+            cache_set(self.cache, cache_key, metrics)
             return metrics
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             logger.error("Lighthouse timeout")
             return self._get_mock_lighthouse_data()
         except FileNotFoundError:
@@ -336,11 +522,19 @@ class LighthouseExtractor:
 class GoogleTrendsExtractor:
     """Extract keyword trends from Google Trends"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[Cache] = None):
+        self.cache = cache
         self.pytrends = TrendReq(hl='en-US', tz=360)
     
     def get_interest_over_time(self, keywords: List[str], timeframe: str = 'today 3-m') -> Dict:
         """Fetch interest over time for keywords"""
+        # Sorted so the same keyword set hits the cache whatever order it is listed in
+        cache_key = ('trends', tuple(sorted(keywords)), timeframe)
+        cached = cache_get(self.cache, cache_key)
+        if cached is not None:
+            logger.info(f"Google Trends: Using cached data for {keywords}")
+            return cached
+        
         try:
             logger.info(f"Fetching Google Trends for keywords: {keywords}")
             
@@ -358,22 +552,19 @@ class GoogleTrendsExtractor:
                 logger.warning("No Google Trends data available")
                 return self._get_mock_trends_data(keywords)
             
+            # Keyword columns only (drops pytrends' isPartial flag)
+            interest = df[[keyword for keyword in keywords if keyword in df.columns]]
+            
             # Calculate average trend score
-            trend_scores = {}
-            trend_data = []
+            trend_scores = interest.mean().round(2).to_dict()
             
-            for keyword in keywords:
-                if keyword in df.columns:
-                    avg_score = df[keyword].mean()
-                    trend_scores[keyword] = round(avg_score, 2)
-                    
-                    # Convert to time series data
-                    for date, value in df[keyword].items():
-                        trend_data.append({
-                            'date': date.strftime('%Y-%m-%d'),
-                            'keyword': keyword,
-                            'interest': int(value)
-                        })
+            # Convert to long-form time series data in one vectorized pass
+            long_form = interest.rename_axis('date').reset_index().melt(
+                id_vars='date', var_name='keyword', value_name='interest'
+            )
+            long_form['date'] = long_form['date'].dt.strftime('%Y-%m-%d')
+            long_form['interest'] = long_form['interest'].astype(int)
+            trend_data = long_form.to_dict('records')
             
             overall_trend = statistics.mean(trend_scores.values()) if trend_scores else 0
             
@@ -384,6 +575,7 @@ class GoogleTrendsExtractor:
             }
             
             logger.info(f"Google Trends: Overall score {overall_trend}")
+            cache_set(self.cache, cache_key, metrics)
             return metrics
             
         except Exception as e:
@@ -410,97 +602,195 @@ class GoogleTrendsExtractor:
             'keyword_scores': {k: 65.5 for k in keywords}
         }
 
+# Append-only run history, one JSON object per line
+HISTORY_PATH = './public/master_seo_data.jsonl'
+# Records older than this are dropped by compact()
+HISTORY_RETENTION_DAYS = 30
+# compact() only runs once the oldest record is this far past retention, so under the
+# daily sync the history is rewritten about weekly rather than on every save
+HISTORY_COMPACTION_SLACK_DAYS = 7
+# Raw extractor responses live next to the history as zstd sidecars
+RAW_METADATA_DIR = 'raw'
+ZSTD_LEVEL = 3
+
+def record_epoch(record: Dict) -> float:
+    """Epoch seconds of a history record (parsing the ISO timestamp only for pre-epoch records)"""
+    epoch = record.get('timestamp_epoch')
+    if epoch is None:
+        epoch = datetime.fromisoformat(record['timestamp']).timestamp()
+    return epoch
+
+def retention_cutoff_epoch(retention_days: int = HISTORY_RETENTION_DAYS) -> int:
+    """Epoch seconds before which history records are expired"""
+    return int(time.time()) - retention_days * 86400
+
+def oldest_record_epoch(history_file: Path) -> Optional[float]:
+    """Epoch of the first (oldest, the file being append-only) history record"""
+    with open(history_file, 'rb') as f:
+        for line in f:
+            if line.strip():
+                return record_epoch(json_loads(line))
+    return None
+
+def raw_metadata_path(history_file: Path, timestamp: str) -> Path:
+    """Sidecar file holding the raw extractor metadata of one history record"""
+    # Microsecond resolution, so saves within the same second get distinct files
+    stamp = datetime.fromisoformat(timestamp).strftime('%Y%m%dT%H%M%S%f')
+    return history_file.parent / RAW_METADATA_DIR / f"{stamp}.json.zst"
+
+# SEODataPoint fields filled from each extractor's result (keys match field names)
+PARTIAL_FIELDS = {
+    'ahrefs': ('domain_rating', 'backlinks', 'referring_domains'),
+    'screaming_frog': ('technical_health_score', 'crawl_errors'),
+    'surfer_seo': ('content_score',),
+    'lighthouse': (
+        'lighthouse_performance',
+        'lighthouse_seo',
+        'lighthouse_accessibility',
+        'lighthouse_best_practices'
+    ),
+    'google_trends': ('trend_score', 'trend_data')
+}
+
+async def _tagged(source: str, awaitable) -> Tuple[str, Dict]:
+    """Pair an extractor's result with its source name (as_completed drops task identity)"""
+    return source, await awaitable
+
 class SEOPipeline:
     """Main orchestrator for SEO data pipeline"""
     
     def __init__(self, config: Dict):
         self.config = config
-        self.ahrefs = AhrefsExtractor(config.get('ahrefs_token', ''))
+        self.cache = Cache(config.get('cache_dir', CACHE_DIR))
+        self.ahrefs = AhrefsExtractor(config.get('ahrefs_token', ''), self.cache)
         self.screaming_frog = ScreamingFrogExtractor(config.get('screaming_frog_path', 'screamingfrogseospider'))
-        self.surfer = SurferSEOExtractor(config.get('surfer_api_key', ''))
-        self.lighthouse = LighthouseExtractor()
-        self.trends = GoogleTrendsExtractor()
+        self.surfer = SurferSEOExtractor(config.get('surfer_api_key', ''), self.cache)
+        self.lighthouse = LighthouseExtractor(self.cache)
+        self.trends = GoogleTrendsExtractor(self.cache)
     
-    def run_full_pipeline(self, url: str, keywords: List[str]) -> SEODataPoint:
+    async def run_full_pipeline(self, url: str, keywords: List[str]) -> SEODataPoint:
         """Execute full SEO data extraction pipeline"""
+        data_point = None
+        async for data_point in self.run_full_pipeline_stream(url, keywords):
+            pass
+        
+        logger.info("Pipeline execution complete")
+        return data_point
+    
+    async def run_full_pipeline_stream(self, url: str, keywords: List[str]) -> AsyncIterator[SEODataPoint]:
+        """Run all extractors concurrently, yielding the data point as each one finishes
+        
+        The same SEODataPoint is updated in place and yielded once per extractor;
+        it is complete after the last yield.
+        """
         logger.info(f"Starting full SEO pipeline for {url}")
         
         # Extract domain from URL
-        from urllib.parse import urlparse
-        domain = urlparse(url).netloc
-        
-        # Run all extractors
-        ahrefs_data = self.ahrefs.get_domain_metrics(domain)
-        sf_data = self.screaming_frog.crawl_site(url)
-        surfer_data = self.surfer.get_content_score(url, keywords[0] if keywords else "")
-        lighthouse_data = self.lighthouse.run_audit(url)
-        trends_data = self.trends.get_interest_over_time(keywords)
+        domain = _netloc(url)
         
-        # Combine all data
+        now = datetime.now()
         data_point = SEODataPoint(
-            timestamp=datetime.now().isoformat(),
+            timestamp=now.isoformat(),
             url=url,
-            domain_rating=ahrefs_data.get('domain_rating'),
-            backlinks=ahrefs_data.get('backlinks'),
-            referring_domains=ahrefs_data.get('referring_domains'),
-            technical_health_score=sf_data.get('technical_health_score'),
-            crawl_errors=sf_data.get('crawl_errors'),
-            content_score=surfer_data.get('content_score'),
-            lighthouse_performance=lighthouse_data.get('lighthouse_performance'),
-            lighthouse_seo=lighthouse_data.get('lighthouse_seo'),
-            lighthouse_accessibility=lighthouse_data.get('lighthouse_accessibility'),
-            lighthouse_best_practices=lighthouse_data.get('lighthouse_best_practices'),
-            trend_score=trends_data.get('trend_score'),
-            trend_data=trends_data.get('trend_data'),
-            metadata={
-                'ahrefs': ahrefs_data,
-                'screaming_frog': sf_data,
-                'surfer_seo': surfer_data,
-                'lighthouse': lighthouse_data,
-                'google_trends': trends_data
-            }
+            timestamp_epoch=int(now.timestamp()),
+            # Pre-seeded so the source order is stable whatever order results arrive in
+            metadata={source: {} for source in PARTIAL_FIELDS}
         )
         
-        logger.info("Pipeline execution complete")
+        tasks = [
+            asyncio.create_task(_tagged('ahrefs', self.ahrefs.get_domain_metrics(domain))),
+            asyncio.create_task(_tagged('screaming_frog', self.screaming_frog.crawl_site(url))),
+            asyncio.create_task(_tagged('surfer_seo', self.surfer.get_content_score(url, keywords[0] if keywords else ""))),
+            asyncio.create_task(_tagged('lighthouse', self.lighthouse.run_audit(url))),
+            asyncio.create_task(_tagged('google_trends', asyncio.to_thread(self.trends.get_interest_over_time, keywords)))
+        ]
+        
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                source, result = await next_result
+                yield self._merge_partial(data_point, source, result)
+        finally:
+            # Consumer stopped early or an extractor raised: don't leave work running
+            for task in tasks:
+                task.cancel()
+    
+    def _merge_partial(self, data_point: SEODataPoint, source: str, result: Dict) -> SEODataPoint:
+        """Copy one extractor's result onto the data point"""
+        for field_name in PARTIAL_FIELDS[source]:
+            setattr(data_point, field_name, result.get(field_name))
+        data_point.metadata[source] = result
         return data_point
     
-    def save_to_json(self, data: SEODataPoint, output_path: str = './public/master_seo_data.json'):
-        """Save processed data to JSON file"""
+    async def close(self):
+        """Close the extractors' pooled HTTP sessions"""
+        await asyncio.gather(self.ahrefs.close(), self.surfer.close())
+    
+    def save_to_json(self, data: SEODataPoint, output_path: str = HISTORY_PATH):
+        """Append processed data to the JSONL history file"""
         try:
-            # Convert dataclass to dict
-            data_dict = asdict(data)
+            # Shallow field dict (no asdict deep copy of trend_data / metadata);
+            # the raw extractor blobs are stored separately
+            data_dict = {field.name: getattr(data, field.name) for field in fields(data)}
+            metadata = data_dict.pop('metadata')
             
-            # Load existing data if available
             output_file = Path(output_path)
-            historical_data = []
-            
-            if output_file.exists():
-                with open(output_file, 'r') as f:
-                    existing = json.load(f)
-                    if isinstance(existing, list):
-                        historical_data = existing
-                    else:
-                        historical_data = [existing]
-            
-            # Append new data
-            historical_data.append(data_dict)
-            
-            # Keep only last 30 days
-            cutoff_date = datetime.now() - timedelta(days=30)
-            historical_data = [
-                d for d in historical_data 
-                if datetime.fromisoformat(d['timestamp']) > cutoff_date
-            ]
-            
-            # Save to file
+            if metadata is not None:
+                raw_file = raw_metadata_path(output_file, data_dict['timestamp'])
+                raw_file.parent.mkdir(parents=True, exist_ok=True)
+                raw_file.write_bytes(
+                    zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(json_dumps_line(metadata))
+                )
+            
+            # One compact JSON object per line: saving never rereads the history
             output_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_file, 'w') as f:
-                json.dump(historical_data, f, indent=2)
+            with open(output_file, 'ab') as f:
+                f.write(json_dumps_line(data_dict))
             
             logger.info(f"Data saved to {output_path}")
             
+            # Retention is enforced lazily: reading the first line is enough to tell
+            # whether the oldest record is past retention plus the compaction slack
+            oldest = oldest_record_epoch(output_file)
+            compaction_cutoff = retention_cutoff_epoch(HISTORY_RETENTION_DAYS + HISTORY_COMPACTION_SLACK_DAYS)
+            if oldest is not None and oldest <= compaction_cutoff:
+                self.compact(output_path)
+            
         except Exception as e:
             logger.error(f"Error saving JSON: {str(e)}")
+    
+    def compact(self, output_path: str = HISTORY_PATH, retention_days: int = HISTORY_RETENTION_DAYS):
+        """Rewrite the JSONL history keeping only the last retention_days of records"""
+        # Raw metadata sidecars of dropped records are deleted as well
+        output_file = Path(output_path)
+        if not output_file.exists():
+            return
+        
+        cutoff_epoch = retention_cutoff_epoch(retention_days)
+        temp_file = output_file.with_suffix('.jsonl.tmp')
+        kept = dropped = 0
+        
+        with open(output_file, 'rb') as src, open(temp_file, 'wb') as dst:
+            for line in src:
+                if not line.strip():
+                    continue
+                record = json_loads(line)
+                if record_epoch(record) > cutoff_epoch:
+                    dst.write(line)
+                    kept += 1
+                else:
+                    raw_metadata_path(output_file, record['timestamp']).unlink(missing_ok=True)
+                    dropped += 1
+        
+        # Atomic swap so readers never see a half-written history
+        temp_file.replace(output_file)
+        logger.info(f"Compacted {output_path}: kept {kept}, dropped {dropped} records")
+
+async def run_pipeline(pipeline: SEOPipeline, url: str, keywords: List[str]) -> SEODataPoint:
+    """Run the pipeline once, closing its HTTP sessions before the event loop ends"""
+    try:
+        return await pipeline.run_full_pipeline(url, keywords)
+    finally:
+        await pipeline.close()
 
 def main():
     """Main execution function"""
@@ -517,7 +807,7 @@ def main():
     
     # Initialize and run pipeline
     pipeline = SEOPipeline(config)
-    seo_data = pipeline.run_full_pipeline(target_url, keywords)
+    seo_data = asyncio.run(run_pipeline(pipeline, target_url, keywords))
     pipeline.save_to_json(seo_data)
     
     logger.info("✓ SEO Pipeline completed successfully")
@@ -0,0 +1,14 @@
+"""
+Build the compiled scoring extension with mypyc:
+
+    python setup.py build_ext --inplace
+
+Without the build step, scoring.py is imported as plain Python.
+"""
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name='seo-scoring',
+    ext_modules=mypycify(['scoring.py']),
+)